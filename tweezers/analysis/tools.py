@@ -589,7 +589,7 @@ def segmentSummaryFig(analysis, segId, display=True, saveDir=None):
     txtArgs = {'fontsize': 12, 'verticalalignment': 'top'}
 
     # general info
-    txtId = s.id.translate(str.maketrans({'_': '\_', '#': '\#'}))
+    txtId = s.id.translate(str.maketrans({'_': r'\_', '#': r'\#'}))
     txt = r'\textbf{{Exp ID:}}\\\\{}\\\\'.format(txtId) + \
           r'\begin{tabular}{l r l}' + \
           r'Temperature: & {:.1f} & {}\\'.format(m.temperature, u.temperature) + \
@@ -837,7 +837,7 @@ def segmentSummaryFigByFit(analysis, segId, display=True, saveDir=None):
     txtArgs = {'fontsize': 12, 'verticalalignment': 'top'}
 
     # general info
-    txtId = s.id.translate(str.maketrans({'_': '\_', '#': '\#'}))
+    txtId = s.id.translate(str.maketrans({'_': r'\_', '#': r'\#'}))
     txt = r'\textbf{{Exp ID:}}\\\\{}\\\\'.format(txtId) + \
           r'\begin{tabular}{l r l}' + \
           r'Temperature: & {:.1f} & {}\\'.format(m.temperature, u.temperature) + \
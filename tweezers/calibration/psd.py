@@ -32,16 +32,16 @@ def computePsd(data, samplingFreq=100000, blockLength=10000, overlap=0):
 
     # the size of each step
     stepSize = blockLength - overlap
-    # container to store result
-    psdList = []
-    for n in range(blockLength, len(data) + 1, stepSize):
-        # get individual block psd and add it to our list
-        f, psd = sp.signal.welch(data[n - blockLength:n], fs=samplingFreq, nperseg=blockLength, noverlap=0,
-                                 window='boxcar')
-        # append PSD to list but exclude f = 0
-        psdList.append(psd[1:])
+    # view the data as a matrix with one block per row, without copying it, and compute the PSD of all blocks in a
+    # single call instead of one call per block
+    data = np.asarray(data)
+    nBlocks = (len(data) - blockLength) // stepSize + 1
+    blocks = np.lib.stride_tricks.as_strided(data, shape=(nBlocks, blockLength),
+                                             strides=(stepSize * data.strides[0], data.strides[0]))
+    f, psdList = sp.signal.welch(blocks, fs=samplingFreq, nperseg=blockLength, noverlap=0, window='boxcar', axis=-1)
+    # exclude f = 0
     f = f[1:]
-    psdList = np.array(psdList)
+    psdList = psdList[:, 1:]
     # averaged psd
     psdAv = psdList.mean(axis=0)
     # use ddof=1 to compute the std by dividing by (n-1) (sample standard deviation)
@@ -100,17 +100,20 @@ def computePsdBlocking(data, samplingFreq=100000, nblocks=100, log=True):
     else:
         bins = np.linspace(f[0], f[-1], nblocks + 1, endpoint=True)
 
+    # the frequencies are sorted, so each bin is a contiguous slice and all bin edges can be found in one go instead of
+    # comparing the full frequency array against the edges of every bin
+    edges = np.searchsorted(f, bins, side='left')
+
     psdav = {'f': [], 'psdMean': [], 'psdStd': [], 'n': []}
-    for i in range(len(bins) - 1):
-        idx = (f >= bins[i]) & (f < bins[i + 1])
-        n = np.sum(idx)
+    for start, stop in zip(edges[:-1], edges[1:]):
+        n = stop - start
         if n > 0:
-            psdav['f'] += [np.nanmean(f[idx])]
-            psdav['psdMean'] += [np.nanmean(psd[idx])]
+            psdav['f'] += [np.nanmean(f[start:stop])]
+            psdav['psdMean'] += [np.nanmean(psd[start:stop])]
             if n == 1:
                 psdav['psdStd'] += [np.nan]
             else:
-                psdav['psdStd'] += [np.nanstd(psd[idx], ddof=1)]
+                psdav['psdStd'] += [np.nanstd(psd[start:stop], ddof=1)]
             psdav['n'] += [n]
 
     return psdav
@@ -191,8 +194,7 @@ class PsdFit(fit.LeastSquaresFit):
             :class:`list` of :class:`float`, depending on the input
         """
 
-        fit = self.fcn(self.fFull, *self.coef)
-        return fit
+        return self.eval(self.fFull)
 
 
 class PsdFitMle(fit.Fit):
@@ -61,7 +61,7 @@ class TweezersCollection(IndexedOrderedDict):
         Filter keys based on whether they match a regular filter expression or not.
 
         Args:
-            filterExp (`str`): regular expression to filter keys
+            filterExp (`str` or compiled pattern): regular expression to filter keys
 
         Returns:
             :class:`.TweezersCollection`
@@ -74,10 +74,11 @@ class TweezersCollection(IndexedOrderedDict):
                  fids = ids.filter('2017-03.*Hyd')
         """
 
-        # string based filter for keys
+        # string based filter for keys, compile the expression once for all keys
+        regex = re.compile(filterExp)
         res = self.__class__()
         for key in self.keys():
-            if re.search(filterExp, key):
+            if regex.search(key):
                 res[key] = self[key]
 
         return res
@@ -227,7 +228,7 @@ class TweezersDataCollection(TweezersCollection):
                                  '"YYYY-MM-DD" notation')
         if not isinstance(date, datetime):
             raise ValueError('filterByDate: `date` is not a `datetime.datetime` object')
-        if method is 'between':
+        if method == 'between':
             if isinstance(endDate, str):
                 try:
                     endDate = datetime.strptime(endDate, '%Y-%m-%d')
@@ -249,11 +250,11 @@ class TweezersDataCollection(TweezersCollection):
 
             # or work on current item
             time = item.source.getTime()
-            if method is 'newer' and time >= date:
+            if method == 'newer' and time >= date:
                 res[key] = item
-            elif method is 'older' and time <= date:
+            elif method == 'older' and time <= date:
                 res[key] = item
-            elif method is 'between' and date <= time <= endDate:
+            elif method == 'between' and date <= time <= endDate:
                 res[key] = item
         return res
 
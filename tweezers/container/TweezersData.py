@@ -9,8 +9,6 @@ from tweezers.ixo.collections import IndexedOrderedDict
 from tweezers.ixo.decorators import lazy
 from tweezers.ixo.statistics import averageData
 from tweezers.meta import MetaDict, UnitDict
-from tweezers.plot.psd import PsdFitPlot
-from tweezers.plot.utils import peekPlot
 import tweezers.calibration.psd as psd
 import tweezers.calibration.thermal as thermal
 from tweezers.physics.tweezers import tcOsciHydroCorrect
@@ -302,7 +300,8 @@ class TweezersDataBase:
         elif 't' in data.columns:
             index = ['t']
 
-        resDf = pd.DataFrame()
+        # collect the frames and concatenate them once, appending copies the growing result for each column
+        frames = []
         for col in data.columns:
             # skip index columns
             if col in index:
@@ -314,7 +313,9 @@ class TweezersDataBase:
             for m in meta:
                 if m in self.meta[col].keys():
                     tmpDf.loc[:, m] = self.meta[col][m]
-            resDf = resDf.append(tmpDf)
+            frames.append(tmpDf)
+
+        resDf = pd.concat(frames) if frames else pd.DataFrame()
 
         for m in meta:
             if m in self.meta.keys():
@@ -333,6 +334,9 @@ class TweezersDataBase:
             :class:`.TweezersData`
         """
 
+        # matplotlib is only imported when actually plotting, it is slow to load and not needed for the analysis
+        from tweezers.plot.utils import peekPlot
+
         peekPlot(self, *cols)
         return self
 
@@ -344,6 +348,8 @@ class TweezersDataBase:
             :class:`.TweezersData`
         """
 
+        from tweezers.plot.psd import PsdFitPlot
+
         PsdFitPlot(self, residuals=False)
         return self
 
@@ -532,7 +538,9 @@ class TweezersDataSegment(TweezersDataBase):
         """
 
         super().__init__()
-        self.__dict__ = copy.deepcopy(tdInstance.__dict__)
+        # copy everything but the data, the segment only needs a slice of it which is taken below
+        parentDict = tdInstance.__dict__
+        self.__dict__ = copy.deepcopy({key: value for key, value in parentDict.items() if key != 'data'})
         # get the proper key in case numeric indexing was used
         segmentId = self.segments.key(segmentId)
         self.segment = self.segments[segmentId]
@@ -544,12 +552,13 @@ class TweezersDataSegment(TweezersDataBase):
         self.meta['idSafe'] = self.meta['id'].replace('_', ' ').replace('#', '')
 
         # check if data is already read into memory and use that if available
-        if 'data' in self.__dict__:
-            # adjust data
+        if 'data' in parentDict:
+            # adjust data, resetting the index returns a DataFrame that is detached from the parent so it can be
+            # modified without a SettingWithCopyWarning
             queryStr = '{} <= time <= {}'.format(self.segment['tmin'], self.segment['tmax'])
-            self.data = self.data.query(queryStr)
-            self.data = self.data.reset_index(drop=True)
-            self.data.loc[:, 'time'] -= self.data.loc[0, 'time']
+            data = parentDict['data'].query(queryStr).reset_index(drop=True)
+            data.loc[:, 'time'] -= data.loc[0, 'time']
+            self.data = data
             # delete avData if available
             try:
                 self.__dict__.pop('avData')
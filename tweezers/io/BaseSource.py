@@ -1,4 +1,5 @@
 from pathlib import Path
+import os
 
 
 class BaseSource:
@@ -132,6 +133,18 @@ class BaseSource:
 
     @staticmethod
     def isDataFile(path):
+        """
+        Checks if a given file is a valid data file and returns information about it. This is called for every file
+        found by :meth:`getAllFiles` and most files in a folder are not data files, so implementations should reject
+        files on a cheap check of their extension before matching the full file name pattern. For the same reason, only
+        the file name should be matched and a :class:`pathlib.Path` should only be created for valid data files.
+
+        Args:
+            path (:class:`pathlib.Path`, :class:`os.DirEntry` or `str`): file to check
+
+        Returns:
+            `dict` with information about the data file or `False`
+        """
 
         raise NotImplementedError()
 
@@ -152,15 +165,19 @@ class BaseSource:
             `list` of `dict`
         """
 
-        _path = Path(path)
+        _path = path if isinstance(path, Path) else Path(path)
         files = []
 
-        for item in _path.iterdir():
-            if item.is_dir():
-                subFiles = cls.getAllFiles(item)
-                files += subFiles
-            else:
-                m = cls.isDataFile(item)
-                if m:
-                    files.append(m)
+        # scandir returns the file type along with the directory listing, so unlike Path.is_dir() there is no extra
+        # stat call per entry
+        with os.scandir(str(_path)) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    subFiles = cls.getAllFiles(_path / entry.name)
+                    files += subFiles
+                else:
+                    # isDataFile only needs the name, so hand over the entry instead of building a Path for every file
+                    m = cls.isDataFile(entry)
+                    if m:
+                        files.append(m)
         return files
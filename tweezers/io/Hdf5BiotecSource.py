@@ -4,6 +4,8 @@ from collections import OrderedDict
 import pandas as pd
 import numpy as np
 import re
+import os
+import sys
 import datetime
 import h5py
 # import dask.dataframe as dd
@@ -15,8 +17,14 @@ import hdf5storage
 import tweezers.ixo.hdf5 as h5
 
 
+# file name pattern of valid data files, compiled once on import
+DATA_FILE_RE = re.compile(r'^(?P<beadId>[0-9\-_]{19}.*#\d{3})(?P<trial>-\d{3})?\s(?P<type>[a-zA-Z]+)\.h5$')
+# column title with an optional unit in square brackets, e.g. 'pmXForce [pN]'
+COLUMN_TITLE_RE = re.compile(r'(\w+)(?:\s\[(\w*)\])?')
+
+
 class Hdf5BiotecSource(BaseSource):
-    """
+    r"""
     Data source for \*.h5 files from the Biotec tweezers.
     """
 
@@ -57,16 +65,18 @@ class Hdf5BiotecSource(BaseSource):
         Checks if a given file is a valid data file and returns its ID and type.
 
         Args:
-            path (:class:`pathlib.Path`): file to check
+            path (:class:`pathlib.Path`, :class:`os.DirEntry` or `str`): file to check
 
         Returns:
             `dict` with ``id`` and ``type``
         """
 
-        _path = Path(path)
-        m = re.match('^(?P<beadId>[0-9\-_]{19}.*#\d{3})(?P<trial>-\d{3})?\s(?P<type>[a-zA-Z]+)\.h5$',
-                     _path.name)
+        name = os.path.basename(path)
+        if not name.endswith('.h5'):
+            return False
+        m = DATA_FILE_RE.match(name)
         if m:
+            _path = Path(path)
             ide = None
             if m.group('trial'):
                 ide = '{}{}'.format(m.group('beadId'), m.group('trial'))
@@ -348,7 +358,7 @@ class Hdf5BiotecSource(BaseSource):
         # calculate bead distance center to center from video signal, only meaningful for two trapped beads
         data['xDistVid'] = data.pmXBead - data.aodXBead
         data['yDistVid'] = data.pmYBead - data.aodYBead
-        data['distVid'] = np.sqrt((data.pmYBead - data.aodYBead)**2 + (data.pmXBead - data.aodXBead)**2)
+        data['distVid'] = np.hypot(data.xDistVid, data.yDistVid)
         units['xDistVid'] = 'nm'
         units['yDistVid'] = 'nm'
         units['distVid'] = 'nm'
@@ -367,7 +377,7 @@ class Hdf5BiotecSource(BaseSource):
         # calculate bead distance center to center from trap signal
         data['xDistVolt'] = data.xTrapDist - data.pmXDisp - data.aodXDisp
         data['yDistVolt'] = data.yTrapDist - data.pmYDisp - data.aodYDisp
-        data['distVolt'] = np.sqrt(data.xDistVolt**2 + data.yDistVolt**2)
+        data['distVolt'] = np.hypot(data.xDistVolt, data.yDistVolt)
         units['xDistVolt'] = 'nm'
         units['yDistVolt'] = 'nm'
         units['distVolt'] = 'nm'
@@ -392,15 +402,15 @@ class Hdf5BiotecSource(BaseSource):
             cols = f['data'].attrs['cols']
 
         # get column title names with units
-        regex = re.compile('(\w+)(?:\s\[(\w*)\])?')
         colHeaders = []
         colUnits = UnitDict()
         for col in cols:
             colStr = col.decode('utf-8')
-            res = regex.match(colStr)
+            res = COLUMN_TITLE_RE.match(colStr)
             colHeaders.append(res[1])
             if res.group(2):
-                colUnits[res[1]] = res[2]
+                # units repeat across columns and files, share a single string object for each
+                colUnits[res[1]] = sys.intern(res[2])
 
         return {'names': colHeaders, 'units': colUnits}
 
@@ -531,13 +541,16 @@ class Hdf5BiotecSource(BaseSource):
         # read the chunks into memory if they are within the requested limits
         df = []
         for chunk in dataIter:
-            if not t0:
+            if t0 is None:
                 t0 = chunk.absTime.iloc[0]
+                # convert the limits to absolute time once instead of shifting every chunk
+                tminAbs = t0 + tmin
+                tmaxAbs = t0 + tmax
 
-            if chunk.absTime.iloc[0] - t0 > tmax:
+            if chunk.absTime.iloc[0] > tmaxAbs:
                 # stop reading if the upper time limit was reached
                 break
-            selection = chunk[(chunk.absTime - t0 >= tmin) & (chunk.absTime - t0 <= tmax)]
+            selection = chunk[chunk.absTime.between(tminAbs, tmaxAbs)]
             df.append(selection)
 
         # return concatenated dataframe with all the requested data
@@ -615,8 +628,9 @@ class Hdf5ImageIterator:
                 # get the data in the current limits and convert do pandas.DataFrame
                 image = dset[self.n]
                 time = Hdf5BiotecSource.getTimeFromImage(image)
-                # remove row which holds the timestamp data
-                image = np.delete(image, (-1), axis=1)
+                # remove the last column which holds the timestamp data, slicing gives a view instead of the copy
+                # np.delete would make
+                image = image[:, :-1]
                 # update current position
                 self.n += 1
                 # return data
@@ -2,13 +2,46 @@ import numpy as np
 import pandas as pd
 from pathlib import Path
 import re
+import os
 from collections import OrderedDict
+from types import MappingProxyType
 from lumicks import pylake
 
 from tweezers.ixo.collections import IndexedOrderedDict
 from .BaseSource import BaseSource
 from tweezers.meta import MetaDict, UnitDict
 
+
+# file name pattern of valid data files, compiled once on import
+DATA_FILE_RE = re.compile(r'^(?P<beadId>[0-9]{8}\-[0-9]{6}.*)\.h5$')
+# short names of the groups and channels in the HDF5 files, built once at import instead of on every lookup
+SHORT_NAMES = MappingProxyType({
+    'Bead position': 'beads',
+    'Bead position/Bead 1 X': 'bead1x',
+    'Bead position/Bead 1 Y': 'bead1y',
+    'Bead position/Bead 2 X': 'bead2x',
+    'Bead position/Bead 2 Y': 'bead2y',
+    'Bead 1 X': 'bead1x',
+    'Bead 1 Y': 'bead1y',
+    'Bead 2 X': 'bead2x',
+    'Bead 2 Y': 'bead2y',
+    'Force HF': 'force',
+    'Force HF/Force 1x': 'force1x',
+    'Force HF/Force 1y': 'force1y',
+    'Force HF/Force 2x': 'force2x',
+    'Force HF/Force 2y': 'force2y',
+    'Trap position': 'trapPos',
+    'Trap position/1X': 'trapPos1x',
+    'Trap position/1Y': 'trapPos1y',
+    'Force 1x': 'trap1x',
+    'Force 1y': 'trap1y',
+    'Force 2x': 'trap2x',
+    'Force 2y': 'trap2y',
+    '1X': 'trap1x',
+    '1Y': 'trap1y'
+})
+
+
 class Hdf5CTrapSource(BaseSource):
     dataPath = None
     data = None
@@ -38,33 +71,7 @@ class Hdf5CTrapSource(BaseSource):
 
     @staticmethod
     def getShortName(name):
-        names = {
-            'Bead position': 'beads',
-            'Bead position/Bead 1 X': 'bead1x',
-            'Bead position/Bead 1 Y': 'bead1y',
-            'Bead position/Bead 2 X': 'bead2x',
-            'Bead position/Bead 2 Y': 'bead2y',
-            'Bead 1 X': 'bead1x',
-            'Bead 1 Y': 'bead1y',
-            'Bead 2 X': 'bead2x',
-            'Bead 2 Y': 'bead2y',
-            'Force HF': 'force',
-            'Force HF/Force 1x': 'force1x',
-            'Force HF/Force 1y': 'force1y',
-            'Force HF/Force 2x': 'force2x',
-            'Force HF/Force 2y': 'force2y',
-            'Trap position': 'trapPos',
-            'Trap position/1X': 'trapPos1x',
-            'Trap position/1Y': 'trapPos1y',
-            'Force 1x': 'trap1x',
-            'Force 1y': 'trap1y',
-            'Force 2x': 'trap2x',
-            'Force 2y': 'trap2y',
-            '1X': 'trap1x',
-            '1Y': 'trap1y'
-        }
-
-        return names[name]
+        return SHORT_NAMES[name]
 
     def getMetadata(self):
         meta = MetaDict()
@@ -164,16 +171,18 @@ class Hdf5CTrapSource(BaseSource):
         Checks if a given file is a valid data file and returns its ID and type.
 
         Args:
-            path (:class:`pathlib.Path`): file to check
+            path (:class:`pathlib.Path`, :class:`os.DirEntry` or `str`): file to check
 
         Returns:
             `dict` with ``id`` and ``type``
         """
 
-        _path = Path(path)
-        m = re.match('^(?P<beadId>[0-9]{8}\-[0-9]{6}.*)\.h5$',
-                     _path.name)
+        name = os.path.basename(path)
+        if not name.endswith('.h5'):
+            return False
+        m = DATA_FILE_RE.match(name)
         if m:
+            _path = Path(path)
             res = {'beadId': m.group('beadId'),
                    'id': m.group('beadId'),
                    'path': _path}
@@ -1,5 +1,6 @@
-from nptdms import TdmsFile
 import re
+import os
+from types import MappingProxyType
 import pandas as pd
 from pathlib import Path
 from collections import OrderedDict
@@ -9,6 +10,49 @@ import tweezers as t
 from tweezers.ixo.decorators import lazy
 
 
+# file name pattern of valid data files, compiled once on import
+DATA_FILE_RE = re.compile(r'^(?P<beadId>[0-9\-]{15}.*#\d{3})-(?P<trial>\d{3})(?: (?P<type>[A-Z]+))?\.tdms$')
+# property or channel name with an optional unit in round brackets, e.g. 'Distance 1 (um)'
+KEY_UNIT_RE = re.compile(r'^(?P<key>.*?)(?:\s?\((?P<unit>\D+)\))?$')
+# standard identifiers of property and channel data column names, built once at import instead of on every lookup
+PROPERTY_IDS = MappingProxyType({
+    # channel stuff
+    'Force Channel 0': 'chan0Force',
+    'Force Channel 1': 'chan1Force',
+    'Force Channel 2': 'chan2Force',
+    'Force Channel 3': 'chan3Force',
+    'Distance 1': 'dist1',
+    'Distance 2': 'dist2',
+    'Force Channel 0 STDEV': 'chan0ForceStd',
+    'Force Channel 1 STDEV': 'chan1ForceStd',
+    'Force Channel 2 STDEV': 'chan2ForceStd',
+    'Force Channel 3 STDEV': 'chan3ForceStd',
+    'Force Trap 0': 't0Force',
+    'Force Trap 1': 't1Force',
+    'Force Trap 0 STDEV': 't0ForceStd',
+    'Force Trap 1 STDEV': 't1ForceStd',
+    'Bead 1 X position': 'bead1X',
+    'Bead 2 X position': 'bead2X',
+    'Bead 3 X position': 'bead3X',
+    'Bead 4 X position': 'bead4X',
+    'Bead 1 Y position': 'bead1Y',
+    'Bead 2 Y position': 'bead2Y',
+    'Bead 3 Y position': 'bead3Y',
+    'Bead 4 Y position': 'bead4Y',
+
+    # general stuff
+    'Molecule #': 'molecule',
+    'File #': 'file'
+})
+# standard identifiers of channels used to store nested metadata
+CHANNEL_IDS = MappingProxyType({
+    'Force Channel 0': 'chan0',
+    'Force Channel 1': 'chan1',
+    'Force Channel 2': 'chan2',
+    'Force Channel 3': 'chan3',
+})
+
+
 class TdmsCTrapSource(BaseSource):
     """
     Data source for TDMS files from the Lumicks C-Trap.
@@ -42,6 +86,9 @@ class TdmsCTrapSource(BaseSource):
             :class:`nptdms.TdmsFile`
         """
 
+        # import here so loading the package doesn't require importing nptdms unless TDMS files are actually read
+        from nptdms import TdmsFile
+
         return TdmsFile(str(self.data))
 
     @staticmethod
@@ -50,16 +97,18 @@ class TdmsCTrapSource(BaseSource):
         Checks if a given file is a valid data file and returns its ID and type
 
         Args:
-            path (:class:`pathlib.Path`): file to check
+            path (:class:`pathlib.Path`, :class:`os.DirEntry` or `str`): file to check
 
         Returns:
             `dict` with ``id`` and ``type``
         """
 
-        _path = Path(path)
-        m = re.match('^(?P<beadId>[0-9\-]{15}.*#\d{3})-(?P<trial>\d{3})( (?P<type>[A-Z]+))?\.tdms$',
-                     _path.name)
+        name = os.path.basename(path)
+        if not name.endswith('.tdms'):
+            return False
+        m = DATA_FILE_RE.match(name)
         if m:
+            _path = Path(path)
             ide = None
             if m.group('trial'):
                 ide = '{}-{}'.format(m.group('beadId'), m.group('trial'))
@@ -150,16 +199,16 @@ class TdmsCTrapSource(BaseSource):
             :class:`pandas.DataFrame`
         """
 
-        # create emtpy DataFrame
-        data = pd.DataFrame()
         # get all channels from 'FD Data' group
         channels = self.tdms.group_channels('FD Data')
-        # add all the channels to the DataFrame with appropriate column names
+        # collect all the channels with appropriate column names and create the DataFrame in one go instead of
+        # inserting the columns one by one
+        columns = OrderedDict()
         for channel in channels:
             name = self.getKeyAndUnit(channel.channel)
             name = self.getStandardPropertyId(name['key'])
-            data[name] = channel.data
-        return data
+            columns[name] = channel.data
+        return pd.DataFrame(columns)
 
     def getDataSegment(self, tmin, tmax, chunkN=10000):
         """
@@ -272,8 +321,7 @@ class TdmsCTrapSource(BaseSource):
             `dict` with keys: ``key`` and ``unit``
         """
 
-        regex = re.compile('^(?P<key>.*?)(?:\s?\((?P<unit>\D+)\))?$')
-        res = regex.search(key)
+        res = KEY_UNIT_RE.search(key)
         return res.groupdict()
 
     @staticmethod
@@ -292,38 +340,8 @@ class TdmsCTrapSource(BaseSource):
         # one could also change everything to lower case but that would decrease readability
         key = key.strip()
 
-        keyMapper = {
-            # channel stuff
-            'Force Channel 0': 'chan0Force',
-            'Force Channel 1': 'chan1Force',
-            'Force Channel 2': 'chan2Force',
-            'Force Channel 3': 'chan3Force',
-            'Distance 1': 'dist1',
-            'Distance 2': 'dist2',
-            'Force Channel 0 STDEV': 'chan0ForceStd',
-            'Force Channel 1 STDEV': 'chan1ForceStd',
-            'Force Channel 2 STDEV': 'chan2ForceStd',
-            'Force Channel 3 STDEV': 'chan3ForceStd',
-            'Force Trap 0': 't0Force',
-            'Force Trap 1': 't1Force',
-            'Force Trap 0 STDEV': 't0ForceStd',
-            'Force Trap 1 STDEV': 't1ForceStd',
-            'Bead 1 X position': 'bead1X',
-            'Bead 2 X position': 'bead2X',
-            'Bead 3 X position': 'bead3X',
-            'Bead 4 X position': 'bead4X',
-            'Bead 1 Y position': 'bead1Y',
-            'Bead 2 Y position': 'bead2Y',
-            'Bead 3 Y position': 'bead3Y',
-            'Bead 4 Y position': 'bead4Y',
-
-            # general stuff
-            'Molecule #': 'molecule',
-            'File #': 'file'
-        }
-
-        if key in keyMapper.keys():
-            res = keyMapper[key]
+        if key in PROPERTY_IDS:
+            res = PROPERTY_IDS[key]
         else:
             # camelCase the key
             res = TdmsCTrapSource.toCamelCase(key)
@@ -347,15 +365,8 @@ class TdmsCTrapSource(BaseSource):
         # one could also change everything to lower case but that would decrease readability
         key = key.strip()
 
-        keyMapper = {
-            'Force Channel 0': 'chan0',
-            'Force Channel 1': 'chan1',
-            'Force Channel 2': 'chan2',
-            'Force Channel 3': 'chan3',
-        }
-
-        if key in keyMapper.keys():
-            res = keyMapper[key]
+        if key in CHANNEL_IDS:
+            res = CHANNEL_IDS[key]
         else:
             # camelCase the key
             res = TdmsCTrapSource.toCamelCase(key)
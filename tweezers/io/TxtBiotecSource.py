@@ -4,14 +4,22 @@ from collections import OrderedDict
 import pandas as pd
 import numpy as np
 import re
+import os
+import sys
 import datetime
 
 from .BaseSource import BaseSource
 from tweezers.meta import MetaDict, UnitDict
 
 
+# file name pattern of valid data files, compiled once on import
+DATA_FILE_RE = re.compile(r'^(?P<beadId>[0-9\-_]{19}.*#\d{3})(?P<trial>-\d{3})?\s(?P<type>[a-zA-Z]+)\.txt$')
+# column title with an optional unit in square brackets, e.g. 'pmXForce [pN]'
+COLUMN_TITLE_RE = re.compile(r'(\w+)(?:\s\[(\w*)\])?')
+
+
 class TxtBiotecSource(BaseSource):
-    """
+    r"""
     Data source for \*.txt files from the Biotec tweezers.
     """
 
@@ -48,16 +56,18 @@ class TxtBiotecSource(BaseSource):
         Checks if a given file is a valid data file and returns its ID and type
 
         Args:
-            path (:class:`pathlib.Path`): file to check
+            path (:class:`pathlib.Path`, :class:`os.DirEntry` or `str`): file to check
 
         Returns:
             `dict` with ``id`` and ``type``
         """
 
-        _path = Path(path)
-        m = re.match('^(?P<beadId>[0-9\-_]{19}.*#\d{3})(?P<trial>-\d{3})?\s(?P<type>[a-zA-Z]+)\.txt$',
-                     _path.name)
+        name = os.path.basename(path)
+        if not name.endswith('.txt'):
+            return False
+        m = DATA_FILE_RE.match(name)
         if m:
+            _path = Path(path)
             ide = None
             if m.group('trial'):
                 ide = '{}{}'.format(m.group('beadId'), m.group('trial'))
@@ -142,21 +152,25 @@ class TxtBiotecSource(BaseSource):
             :class:`tweezers.MetaDict` and :class:`tweezers.UnitDict`
         """
 
-        headerStr = ''
+        # collect the lines and join them once instead of growing a string line by line
+        headerLines = []
         with self.header.open(encoding='utf-8') as f:
             for line in f:
                 if line.startswith('#'):
+                    # the column titles follow after an empty line, read them while the file is open anyway
+                    next(f)
+                    columnLine = next(f)
                     break
                 else:
-                    headerStr += line
+                    headerLines.append(line)
 
-        header = json.loads(headerStr, object_pairs_hook=OrderedDict)
+        header = json.loads(''.join(headerLines), object_pairs_hook=OrderedDict)
         units = UnitDict(header.pop('units'))
         meta = MetaDict(header)
 
         # add column header units
-        cols = self.readColumnTitles(self.header)
-        units.update(cols['units'])
+        _, colUnits = self.parseColumnTitles(columnLine)
+        units.update(colUnits)
 
         # add id from header file name
         idDict = self.isDataFile(self.header)
@@ -185,6 +199,23 @@ class TxtBiotecSource(BaseSource):
         data = self.readToDataframe(self.data)
         return data
 
+    def getDataIterator(self, chunksize=10000):
+        """
+        Get an iterator that loops through the data and returns chunks of size `chunksize`. This allows processing
+        data files that don't fit into memory at once.
+
+        Args:
+            chunksize (int): Number of rows in the DataFrame returned in each iteration.
+
+        Returns:
+            :class:`pandas.io.parsers.TextFileReader`
+        """
+
+        cols = self.readColumnTitles(self.data)
+        dataIter = pd.read_csv(self.data, sep='\t', skiprows=cols['n'], header=None, names=cols['names'],
+                               chunksize=chunksize, engine='c', dtype=np.float64)
+        return dataIter
+
     def getDataSegment(self, tmin, tmax, chunkN=10000):
         """
         Returns the data between ``tmin`` and ``tmax`` by reading the datafile chunkwise until ``tmax`` is reached.
@@ -198,24 +229,24 @@ class TxtBiotecSource(BaseSource):
             :class:`pandas.DataFrame`
         """
 
-        # read required information about file and create the chunked iterator
-        cols = self.readColumnTitles(self.data)
-        # read the first data line to allow conversion between absolute and relative time
-        firstLine = pd.read_csv(self.data, sep='\t', skiprows=cols['n'], header=None,
-                                names=cols['names'], nrows=1)
-        t0 = firstLine.time.iloc[0]
-        iterCsv = pd.read_csv(self.data, sep='\t', skiprows=cols['n']+1, header=None,
-                              names=cols['names'], iterator=True, chunksize=chunkN, engine='c',
-                              dtype=np.float64)
+        dataIter = self.getDataIterator(chunksize=chunkN)
+        t0 = None
 
         # read the chunks into memory if they are within the requested limits
         df = []
-        for chunk in iterCsv:
-            if chunk['time'].iloc[0] - t0 > tmax:
+        for chunk in dataIter:
+            if t0 is None:
+                # the first data line allows conversion between absolute and relative time, convert the limits to
+                # absolute time once instead of shifting every chunk
+                t0 = chunk['time'].iloc[0]
+                tminAbs = t0 + tmin
+                tmaxAbs = t0 + tmax
+
+            if chunk['time'].iloc[0] > tmaxAbs:
                 # stop reading if the upper time limit was reached
-                iterCsv.close()
+                dataIter.close()
                 break
-            selection = chunk[(chunk['time'] - t0 >= tmin) & (chunk['time'] - t0 <= tmax)]
+            selection = chunk[chunk['time'].between(tminAbs, tmaxAbs)]
             df.append(selection)
 
         # return concatenated dataframe with all the requested data
@@ -272,8 +303,8 @@ class TxtBiotecSource(BaseSource):
         ts.rename(columns={'pmXDiff': 'pmX', 'pmYDiff': 'pmY', 'aodXDiff': 'aodX', 'aodYDiff': 'aodY'},
                   inplace=True)
         # get relative time
-        ts['absTime'] = ts.t.copy()
-        ts.loc[:, 't'] -= ts.loc[0, 't']
+        ts['absTime'] = ts.t
+        ts['t'] = ts.t - ts.t.iloc[0]
 
         return ts
 
@@ -368,9 +399,9 @@ class TxtBiotecSource(BaseSource):
 
         # create relative time column but keep absolute time
         if 'absTime' not in data.columns:
-            data['absTime'] = data.time.copy()
+            data['absTime'] = data.time
             units['absTime'] = 's'
-        data.loc[:, 'time'] -= data.time.iloc[0]
+        data['time'] = data.time - data.time.iloc[0]
 
         # ensure values, set them to 0 if they come as None from the file
         for trap in meta['traps']:
@@ -391,7 +422,7 @@ class TxtBiotecSource(BaseSource):
         # calculate bead distance center to center from trap signal
         data['xDistVolt'] = data.xTrapDist - data.pmXDisp - data.aodXDisp
         data['yDistVolt'] = data.yTrapDist - data.pmYDisp - data.aodYDisp
-        data['distVolt'] = np.sqrt(data.xDistVolt**2 + data.yDistVolt**2)
+        data['distVolt'] = np.hypot(data.xDistVolt, data.yDistVolt)
         units['xDistVolt'] = 'nm'
         units['yDistVolt'] = 'nm'
         units['distVolt'] = 'nm'
@@ -399,7 +430,7 @@ class TxtBiotecSource(BaseSource):
         # calculate bead distance center to center from video signal, only meaningful for two trapped beads
         data['xDistVid'] = data.pmXBead - data.aodXBead
         data['yDistVid'] = data.pmYBead - data.aodYBead
-        data['distVid'] = np.sqrt((data.pmYBead - data.aodYBead)**2 + (data.pmXBead - data.aodXBead)**2)
+        data['distVid'] = np.hypot(data.xDistVid, data.yDistVid)
         units['xDistVid'] = 'nm'
         units['yDistVid'] = 'nm'
         units['distVid'] = 'nm'
@@ -447,9 +478,25 @@ class TxtBiotecSource(BaseSource):
                     n += 2
                     break
 
+        colHeaders, colUnits = self.parseColumnTitles(headerLine)
+
+        return {'names': colHeaders, 'units': colUnits, 'n': n}
+
+    @staticmethod
+    def parseColumnTitles(line):
+        """
+        Extract the column titles and if available their units from the column title line.
+
+        Args:
+            line (`str`): column title line
+
+        Returns:
+            * names (`list`)
+            * units (:class:`.UnitDict`)
+        """
+
         # get column title names with units
-        regex = re.compile('(\w+)(?:\s\[(\w*)\])?')
-        header = regex.findall(headerLine)
+        header = COLUMN_TITLE_RE.findall(line)
 
         # store them in a UnitDict
         colHeaders = []
@@ -457,24 +504,27 @@ class TxtBiotecSource(BaseSource):
         for (colHeader, unit) in header:
             colHeaders.append(colHeader)
             if unit:
-                colUnits[colHeader] = unit
+                # units repeat across columns and files, share a single string object for each
+                colUnits[colHeader] = sys.intern(unit)
 
-        return {'names': colHeaders, 'units': colUnits, 'n': n}
+        return colHeaders, colUnits
 
-    def readToDataframe(self, file):
+    def readToDataframe(self, file, usecols=None):
         """
         Read the given file into a :class:`pandas.DataFrame` and skip the header lines.
 
         Args:
             file (:class:`pathlib.Path`): path to file
+            usecols (`list` of `str`): only read these columns, all columns are read if `None` (default: `None`)
 
         Returns:
             :class:`pandas.DataFrame`
         """
 
         cols = self.readColumnTitles(file)
+        # memory map the file so the parser reads directly from the page cache instead of a separate buffer
         df = pd.read_csv(str(file), sep='\t', dtype=np.float64, skiprows=cols['n'], header=None,
-                         names=cols['names'], engine='c')
+                         names=cols['names'], usecols=usecols, engine='c', memory_map=True)
         return df
 
     def getTime(self):
@@ -1,6 +1,8 @@
 from pathlib import Path
 from collections import OrderedDict
+from types import MappingProxyType
 import re
+import sys
 import json
 import pandas as pd
 import numpy as np
@@ -8,6 +10,264 @@ import numpy as np
 from tweezers.meta import MetaDict, UnitDict
 import tweezers.ixo.utils as ixo
 
+# column titles of the old style files with an optional unit in round brackets, e.g. 'PMx diff (V)'
+COLUMN_TITLE_RE = re.compile(r'(\w+(?:\s\w+)*)(?:\s*\(([^)]*)\))?')
+# column titles of the JSON style files with an optional unit in square brackets, e.g. 'pmXDiff [V]'
+JSON_COLUMN_TITLE_RE = re.compile(r'(\w+)(?:\s\[(\w*)\])?')
+# header lines, regular expression explained:
+# - optionally start with '# '
+# - string that can contain everything except ':' and '(' -> meta identifier
+# - optional whitespace followed by a unit: string with anything but ':', lazy, within brackets '()'
+# - whitespace or ':'
+# - value: optional whitespace followed by any character, this also covers values without whitespaces for
+#   lines without ':' as separator, so no second alternative is required that would be tried on every failing
+#   line
+# - optional final unit consisting of any letter except 'PM' (exclude time stuff)
+HEADER_LINE_RE = re.compile(r'^(?:# )?(?P<name>[^(:\d]*)\s?(?:\((?P<unit>[^:]*?)\)\s?)?[:\s](?P<value>\s?.+?)(?! PM)(?P<unit2>\s\D+)?$')
+# trial number at the start of the file name, with an optional upper case prefix, e.g. 'PSD_12_Date_...'
+TRIAL_NUMBER_RE = re.compile(r'^(?:[A-Z]+_)?(?P<trial>\d+)')
+# header lines that don't hold any metadata, a set allows to discard them without running the header regex
+IGNORED_HEADER_LINES = frozenset([
+    '# Laser Diode Status',
+    '# results thermal calibration:',
+])
+
+
+# translation of the various versions of header keys and column titles to unique identifiers, built once at import
+# instead of on every lookup
+HEADER_KEYS = MappingProxyType({
+    # column titles
+    'freq': 'f',
+    'PMx': 'pmX',
+    'PMy': 'pmY',
+    'AODx': 'aodX',
+    'AODy': 'aodY',
+    'PSDPMx': 'pmX',
+    'PSDPMy': 'pmY',
+    'PSDAODx': 'aodX',
+    'PSDAODy': 'aodY',
+    'FitPMx': 'pmXFit',
+    'FitPMy': 'pmYFit',
+    'FitAODx': 'aodXFit',
+    'FitAODy': 'aodYFit',
+    'PMxdiff': 'pmXDiff',
+    'PMydiff': 'pmYDiff',
+    'PMxsum': 'pmXSum',
+    'AODxdiff': 'aodXDiff',
+    'AODydiff': 'aodYDiff',
+    'AODxsum': 'aodXSum',
+    'FBxsum': 'fbXSum',
+    'FBx': 'fbX',
+    'FBy': 'fbY',
+    'xdist': 'xDist',
+    'ydist': 'yDist',
+    'PMsensorx': 'pmXSensor',
+    'PMsensory': 'pmYSensor',
+    'TrackingReferenceTime': 'trackingReferenceTime',
+
+    # general stuff
+    'Date of Experiment': 'date',
+    'Time of Experiment': 'time',
+    'measurement starttime': 'time',
+    'data averaged to while-loop': 'isDataAveraged',
+
+    'number of samples': 'nSamples',
+    'Number of samples': 'nSamples',
+
+    'sample rate': 'samplingRate',
+    'Sample rate (Hz)': 'samplingRate',
+    'Sample rate': 'samplingRate',
+    'sampleRate.Hz': 'samplingRate',
+
+    'rate of while-loop': 'recordingRate',
+    'duration of measurement': 'measurementDuration',
+    'dt': 'dt',
+    'Delta time': 'dt',
+
+    'number of blocks': 'psdNBlocks',
+
+    'Viscosity': 'viscosity',
+
+    'Laser Diode Temp': 'laserDiodeTemp',
+    'Laser Diode Operating Hours': 'laserDiodeHours',
+    'Laser Diode Current': 'laserDiodeCurrent',
+
+    'errors': 'errors',
+    'start of measurement': 'startOfMeasurement',
+    'end of measurement': 'endOfMeasurement',
+
+    # aod variables
+    'AOD horizontal corner frequency': ['aodX', 'cornerFrequency'],
+    'AOD vertical corner frequency': ['aodY', 'cornerFrequency'],
+    'AOD detector horizontal offset': ['aodX', 'zeroOffset'],
+    'AOD detector vertical offset': ['aodY', 'zeroOffset'],
+    'AOD horizontal trap stiffness': ['aodX', 'stiffness'],
+    'AOD vertical trap stiffness': ['aodY', 'stiffness'],
+    'AOD horizontal OLS': ['aodX', 'displacementSensitivity'],
+    'AOD vertical OLS': ['aodY', 'displacementSensitivity'],
+
+    # pm variables
+    'PM horizontal corner frequency': ['pmX', 'cornerFrequency'],
+    'PM vertical corner frequency': ['pmY', 'cornerFrequency'],
+    'PM detector horizontal offset': ['pmX', 'zeroOffset'],
+    'PM detector vertical offset': ['pmY', 'zeroOffset'],
+    'PM horizontal trap stiffness': ['pmX', 'stiffness'],
+    'PM vertical trap stiffness': ['pmY', 'stiffness'],
+    'PM horizontal OLS': ['pmX', 'displacementSensitivity'],
+    'PM vertical OLS': ['pmY', 'displacementSensitivity'],
+
+    # aod tweebot variables
+    'AOD detector x offset': ['aodX', 'zeroOffset'],
+    'AOD detector y offset': ['aodY', 'zeroOffset'],
+    'AOD trap stiffness x': ['aodX', 'stiffness'],
+    'AOD trap stiffness y': ['aodY', 'stiffness'],
+
+    'xStiffnessT2.pNperNm': ['aodX', 'stiffness'],
+    'yStiffnessT2.pNperNm': ['aodY', 'stiffness'],
+
+    'AOD trap distance conversion x': ['aodX', 'displacementSensitivity'],
+    'AOD trap distance conversion y': ['aodY', 'displacementSensitivity'],
+
+    'xDistConversionT2.VperNm': ['aodX', 'displacementSensitivity'],
+    'yDistConversionT2.VperNm': ['aodY', 'displacementSensitivity'],
+
+    'xCornerFreqT2.Hz': ['aodX', 'cornerFrequency'],
+    'xCornerFreqT2': ['aodX', 'cornerFrequency'],
+    'yCornerFreqT2.Hz': ['aodY', 'cornerFrequency'],
+    'yCornerFreqT2': ['aodY', 'cornerFrequency'],
+
+    'xOffsetT2.V': ['aodX', 'zeroOffset'],
+    'yOffsetT2.V': ['aodY', 'zeroOffset'],
+    'zOffsetT2.V': ['aodZ', 'zeroOffset'],
+
+    # pm tweebot variables
+    'PM detector x offset': ['pmX', 'zeroOffset'],
+    'PM detector y offset': ['pmY', 'zeroOffset'],
+
+    'PM trap stiffness x': ['pmX', 'stiffness'],
+    'PM trap stiffness y': ['pmY', 'stiffness'],
+
+    'xStiffnessT1.pNperNm': ['pmX', 'stiffness'],
+    'yStiffnessT1.pNperNm': ['pmY', 'stiffness'],
+
+    'PM trap distance conversion x': ['pmX', 'displacementSensitivity'],
+    'PM trap distance conversion y': ['pmY', 'displacementSensitivity'],
+
+    'xDistConversionT1.VperNm': ['pmX', 'displacementSensitivity'],
+    'yDistConversionT1.VperNm': ['pmY', 'displacementSensitivity'],
+
+    'xCornerFreqT1.Hz': ['pmX', 'cornerFrequency'],
+    'xCornerFreqT1': ['pmX', 'cornerFrequency'],
+    'yCornerFreqT1.Hz': ['pmY', 'cornerFrequency'],
+    'yCornerFreqT1': ['pmY', 'cornerFrequency'],
+
+    'xOffsetT1.V': ['pmX', 'zeroOffset'],
+    'xOffsetT1': ['pmX', 'zeroOffset'],
+    'yOffsetT1.V': ['pmY', 'zeroOffset'],
+    'yOffsetT1': ['pmY', 'zeroOffset'],
+    'zOffsetT1.V': ['pmZ', 'zeroOffset'],
+
+    # aod tweebot camera variables
+    'AOD ANDOR center x': ['aodX', 'andorCenter'],
+    'AOD ANDOR center y': ['aodY', 'andorCenter'],
+    'AOD ANDOR range x': ['aodX', 'andorRange'],
+    'AOD ANDOR range y': ['aodY', 'andorRange'],
+
+    'AOD CCD center x': ['aodX', 'ccdCenter'],
+    'AOD CCD center y': ['aodY', 'ccdCenter'],
+    'AOD CCD range x': ['aodX', 'ccdRange'],
+    'AOD CCD range y': ['aodY', 'ccdRange'],
+
+    # pm tweebot camera variables
+    'PM ANDOR center x': ['pmX', 'andorCenter'],
+    'PM ANDOR center y': ['pmY', 'andorCenter'],
+    'PM ANDOR range x': ['pmX', 'andorRange'],
+    'PM ANDOR range y': ['pmY', 'andorRange'],
+
+    'PM CCD center x': ['pmX', 'ccdCenter'],
+    'PM CCD center y': ['pmY', 'ccdCenter'],
+    'PM CCD range x': ['pmX', 'ccdRange'],
+    'PM CCD range y': ['pmY', 'ccdRange'],
+
+    # bead
+    'PM bead diameter': ['pmX', 'beadDiameter'],
+    'diameterT1.um': ['pmX', 'beadDiameter'],
+    'PM bead radius': ['pmX', 'beadRadius'],
+
+    'AOD bead diameter': ['aodX', 'beadDiameter'],
+    'diameterT2.um': ['aodX', 'beadDiameter'],
+    'AOD bead radius': ['aodX', 'beadRadius'],
+
+    # andor camera specifics
+    'ANDOR pixel size x': 'andorXPixelSize',
+    'ANDOR pixel size y': 'andorYPixelSize',
+
+    # ccd camera specifics
+    'CCD pixel size x': 'ccdXPixelSize',
+    'CCD pixel size y': 'ccdYPixelSize'
+})
+
+# converters for header values, keyed by their standard identifier
+HEADER_VALUE_TYPES = MappingProxyType({
+    # general stuff
+    'title': str,
+    'time': str,
+
+    # axis variables
+    'forceSensitivity': float,
+
+    # general stuff
+    'date': lambda x: x.replace('\t', ' '),
+    'isDataAveraged': ixo.strToBool,
+    'nSamples': lambda x: int(float(x)),
+    'psdNSamples': int,
+    'psdSamplingRate': int,
+    'tsNSamples': int,
+    'tsTimeStep': float,
+    'samplingRate': int,
+    'recordingRate': int,
+    'measurementDuration': float,
+    'timeStep': float,
+    'dt': float,
+    'psdBlockLength': int,
+    'psdOverlap': int,
+    'psdNBlocks': lambda x: int(float(x)),
+    'viscosity': float,
+
+    'laserDiodeTemp': float,
+    'laserDiodeHours': float,
+    'laserDiodeCurrent': float,
+
+    'errors': lambda x: [int(error) for error in x.split('\t')],
+
+    'startOfMeasurement': int,
+    'endOfMeasurement': int,
+
+    # axis variables
+    'cornerFrequency': float,
+    'zeroOffset': float,
+    'stiffness': float,
+    'displacementSensitivity': lambda x: 1 / float(x),
+
+    # bead
+    'beadDiameter': float,
+    'beadRadius': float,
+
+    # tweebot camera variables
+    'andorCenter': float,
+    'andorRange': float,
+    'ccdCenter': float,
+    'ccdRange': float,
+
+    # andor camera specifics
+    'andorXPixelSize': float,
+    'andorYPixelSize': float,
+
+    # ccd camera specifics
+    'ccdXPixelSize': float,
+    'ccdYPixelSize': float
+})
+
 
 class TxtMpiFile:
     """
@@ -90,15 +350,16 @@ class TxtMpiFile:
             - :class:`.UnitDict` -- units
         """
 
-        headerStr = ''
+        # collect the lines and join them once instead of growing a string line by line
+        headerLines = []
         with self.path.open(encoding='utf-8') as f:
             for line in f:
                 if line.startswith('#'):
                     break
                 else:
-                    headerStr += line
+                    headerLines.append(line)
 
-        header = json.loads(headerStr, object_pairs_hook=OrderedDict)
+        header = json.loads(''.join(headerLines), object_pairs_hook=OrderedDict)
         units = UnitDict(header.pop('units'))
         meta = MetaDict(header)
 
@@ -116,7 +377,8 @@ class TxtMpiFile:
         headerLines = []
         with self.path.open(encoding='utf-8') as f:
             for line in f:
-                if line.strip() and line.startswith('#'):
+                # a line starting with '#' is never blank, so no need to strip every line of the file
+                if line.startswith('#'):
                     headerLines.append(line)
         meta, units = self.convertHeader(headerLines)
 
@@ -167,31 +429,25 @@ class TxtMpiFile:
 
         meta = MetaDict()
         units = UnitDict()
-        # regular expression explained:
-        # - optionally start with '# '
-        # - string that can contain everything except ':' and '(' -> meta identifier
-        # - optional whitespace followed by a unit: string with anything but ':', lazy, within brackets '()'
-        # - whitespace or ':'
-        # - value can be either:
-        #   - optional whitespace followed by any character
-        #   - anything without whitespaces (required for lines without ':' as separator)
-        # - optional final unit consisting of any letter except 'PM' (exclude time stuff)
-        regex = re.compile('^(# )?(?P<name>[^(:\d]*)\s?(\((?P<unit>[^:]*?)\)\s?)?(:|\s)(?P<value>\s?.+?|[^\s]+)(?! PM)(?P<unit2>\s\D+)?$')
         for line in headerLines:
             # check if line should be ignored
             if self.isIgnoredHeader(line):
                 continue
             # perform regular expression search
-            res = regex.search(line)
+            res = HEADER_LINE_RE.search(line)
+            if not res:
+                continue
+            # fetch all groups in one call instead of looking them up one by one
+            name, unitStr, value, unit2Str = res.group('name', 'unit', 'value', 'unit2')
 
-            # no match or empty name or value? go to next line
-            if not res or res.group('name') is None or res.group('value') is None:
+            # empty name or value? go to next line
+            if name is None or value is None:
                 continue
 
             # get list of keys to the object, usually not longer than 2
-            key = self.getStandardIdentifier(res.group('name'))
+            key = self.getStandardIdentifier(name)
             # check for value type in MetaDict
-            value = res.group('value').strip()
+            value = value.strip()
             valueKey = key[-1]
             value = self.getValueType(valueKey, value)
 
@@ -199,19 +455,17 @@ class TxtMpiFile:
             if key[0] == 'date':
                 # do we also have the time appended?
                 splitted = value.split('\t')
-                try:
+                if len(splitted) > 1:
                     meta['time'] = splitted[1]
-                except IndexError:
-                    pass
                 value = splitted[0].replace('/', '.')
 
             # store value
             self.setMeta(meta, key, value)
             unit = None
-            if not res.group('unit') is None:
-                unit = res.group('unit').strip()
-            elif not res.group('unit2') is None:
-                unit = units, key, res.group('unit2').strip()
+            if unitStr is not None:
+                unit = unitStr.strip()
+            elif unit2Str is not None:
+                unit = units, key, unit2Str.strip()
             if unit:
                 self.setMeta(units, key, unit)
 
@@ -235,8 +489,7 @@ class TxtMpiFile:
                     break
 
         # get column units
-        regex = re.compile('(\w+(?:\s\w+)*)(?:\s*\(([^)]*)\))?')
-        res = regex.findall(columnLine)
+        res = COLUMN_TITLE_RE.findall(columnLine)
 
         columns = []
         units = UnitDict()
@@ -247,7 +500,7 @@ class TxtMpiFile:
             column = self.getStandardIdentifier(column)[0]
             columns.append(column)
             if unit:
-                units[column] = unit
+                units[column] = sys.intern(unit)
 
         return {'names': columns, 'units': units, 'n': n}
 
@@ -272,8 +525,7 @@ class TxtMpiFile:
                     break
 
         # get column title names with units
-        regex = re.compile('(\w+)(?:\s\[(\w*)\])?')
-        header = regex.findall(columnLine)
+        header = JSON_COLUMN_TITLE_RE.findall(columnLine)
 
         # store them in a UnitDict
         colHeaders = []
@@ -281,7 +533,7 @@ class TxtMpiFile:
         for (colHeader, unit) in header:
             colHeaders.append(colHeader)
             if unit:
-                colUnits[colHeader] = unit
+                colUnits[colHeader] = sys.intern(unit)
 
         return {'names': colHeaders, 'units': colUnits, 'n': n}
 
@@ -313,7 +565,7 @@ class TxtMpiFile:
             `str`
         """
 
-        res = re.match('^([A-Z]+_)?(?P<trial>\d+)', self.path.stem)
+        res = TRIAL_NUMBER_RE.match(self.path.stem)
         return res.group('trial')
 
     @staticmethod
@@ -332,186 +584,12 @@ class TxtMpiFile:
         # one could also change everything to lower case but that would decrease readability
         key = key.strip()
 
-        keyMapper = {
-            # column titles
-            'freq': 'f',
-            'PMx': 'pmX',
-            'PMy': 'pmY',
-            'AODx': 'aodX',
-            'AODy': 'aodY',
-            'PSDPMx': 'pmX',
-            'PSDPMy': 'pmY',
-            'PSDAODx': 'aodX',
-            'PSDAODy': 'aodY',
-            'FitPMx': 'pmXFit',
-            'FitPMy': 'pmYFit',
-            'FitAODx': 'aodXFit',
-            'FitAODy': 'aodYFit',
-            'PMxdiff': 'pmXDiff',
-            'PMydiff': 'pmYDiff',
-            'PMxsum': 'pmXSum',
-            'AODxdiff': 'aodXDiff',
-            'AODydiff': 'aodYDiff',
-            'AODxsum': 'aodXSum',
-            'FBxsum': 'fbXSum',
-            'FBx': 'fbX',
-            'FBy': 'fbY',
-            'xdist': 'xDist',
-            'ydist': 'yDist',
-            'PMsensorx': 'pmXSensor',
-            'PMsensory': 'pmYSensor',
-            'TrackingReferenceTime': 'trackingReferenceTime',
-
-            # general stuff
-            'Date of Experiment': 'date',
-            'Time of Experiment': 'time',
-            'measurement starttime': 'time',
-            'data averaged to while-loop': 'isDataAveraged',
-
-            'number of samples': 'nSamples',
-            'Number of samples': 'nSamples',
-
-            'sample rate': 'samplingRate',
-            'Sample rate (Hz)': 'samplingRate',
-            'Sample rate': 'samplingRate',
-            'sampleRate.Hz': 'samplingRate',
-
-            'rate of while-loop': 'recordingRate',
-            'duration of measurement': 'measurementDuration',
-            'dt': 'dt',
-            'Delta time': 'dt',
-
-            'number of blocks': 'psdNBlocks',
-
-            'Viscosity': 'viscosity',
-
-            'Laser Diode Temp': 'laserDiodeTemp',
-            'Laser Diode Operating Hours': 'laserDiodeHours',
-            'Laser Diode Current': 'laserDiodeCurrent',
-
-            'errors': 'errors',
-            'start of measurement': 'startOfMeasurement',
-            'end of measurement': 'endOfMeasurement',
-
-            # aod variables
-            'AOD horizontal corner frequency': ['aodX', 'cornerFrequency'],
-            'AOD vertical corner frequency': ['aodY', 'cornerFrequency'],
-            'AOD detector horizontal offset': ['aodX', 'zeroOffset'],
-            'AOD detector vertical offset': ['aodY', 'zeroOffset'],
-            'AOD horizontal trap stiffness': ['aodX', 'stiffness'],
-            'AOD vertical trap stiffness': ['aodY', 'stiffness'],
-            'AOD horizontal OLS': ['aodX', 'displacementSensitivity'],
-            'AOD vertical OLS': ['aodY', 'displacementSensitivity'],
-
-            # pm variables
-            'PM horizontal corner frequency': ['pmX', 'cornerFrequency'],
-            'PM vertical corner frequency': ['pmY', 'cornerFrequency'],
-            'PM detector horizontal offset': ['pmX', 'zeroOffset'],
-            'PM detector vertical offset': ['pmY', 'zeroOffset'],
-            'PM horizontal trap stiffness': ['pmX', 'stiffness'],
-            'PM vertical trap stiffness': ['pmY', 'stiffness'],
-            'PM horizontal OLS': ['pmX', 'displacementSensitivity'],
-            'PM vertical OLS': ['pmY', 'displacementSensitivity'],
-
-            # aod tweebot variables
-            'AOD detector x offset': ['aodX', 'zeroOffset'],
-            'AOD detector y offset': ['aodY', 'zeroOffset'],
-            'AOD trap stiffness x': ['aodX', 'stiffness'],
-            'AOD trap stiffness y': ['aodY', 'stiffness'],
-
-            'xStiffnessT2.pNperNm': ['aodX', 'stiffness'],
-            'yStiffnessT2.pNperNm': ['aodY', 'stiffness'],
-
-            'AOD trap distance conversion x': ['aodX', 'displacementSensitivity'],
-            'AOD trap distance conversion y': ['aodY', 'displacementSensitivity'],
-
-            'xDistConversionT2.VperNm': ['aodX', 'displacementSensitivity'],
-            'yDistConversionT2.VperNm': ['aodY', 'displacementSensitivity'],
-
-            'xCornerFreqT2.Hz': ['aodX', 'cornerFrequency'],
-            'xCornerFreqT2': ['aodX', 'cornerFrequency'],
-            'yCornerFreqT2.Hz': ['aodY', 'cornerFrequency'],
-            'yCornerFreqT2': ['aodY', 'cornerFrequency'],
-
-            'xOffsetT2.V': ['aodX', 'zeroOffset'],
-            'yOffsetT2.V': ['aodY', 'zeroOffset'],
-            'zOffsetT2.V': ['aodZ', 'zeroOffset'],
-
-            # pm tweebot variables
-            'PM detector x offset': ['pmX', 'zeroOffset'],
-            'PM detector y offset': ['pmY', 'zeroOffset'],
-
-            'PM trap stiffness x': ['pmX', 'stiffness'],
-            'PM trap stiffness y': ['pmY', 'stiffness'],
-
-            'xStiffnessT1.pNperNm': ['pmX', 'stiffness'],
-            'yStiffnessT1.pNperNm': ['pmY', 'stiffness'],
-
-            'PM trap distance conversion x': ['pmX', 'displacementSensitivity'],
-            'PM trap distance conversion y': ['pmY', 'displacementSensitivity'],
-
-            'xDistConversionT1.VperNm': ['pmX', 'displacementSensitivity'],
-            'yDistConversionT1.VperNm': ['pmY', 'displacementSensitivity'],
-
-            'xCornerFreqT1.Hz': ['pmX', 'cornerFrequency'],
-            'xCornerFreqT1': ['pmX', 'cornerFrequency'],
-            'yCornerFreqT1.Hz': ['pmY', 'cornerFrequency'],
-            'yCornerFreqT1': ['pmY', 'cornerFrequency'],
-
-            'xOffsetT1.V': ['pmX', 'zeroOffset'],
-            'xOffsetT1': ['pmX', 'zeroOffset'],
-            'yOffsetT1.V': ['pmY', 'zeroOffset'],
-            'yOffsetT1': ['pmY', 'zeroOffset'],
-            'zOffsetT1.V': ['pmZ', 'zeroOffset'],
-
-            # aod tweebot camera variables
-            'AOD ANDOR center x': ['aodX', 'andorCenter'],
-            'AOD ANDOR center y': ['aodY', 'andorCenter'],
-            'AOD ANDOR range x': ['aodX', 'andorRange'],
-            'AOD ANDOR range y': ['aodY', 'andorRange'],
-
-            'AOD CCD center x': ['aodX', 'ccdCenter'],
-            'AOD CCD center y': ['aodY', 'ccdCenter'],
-            'AOD CCD range x': ['aodX', 'ccdRange'],
-            'AOD CCD range y': ['aodY', 'ccdRange'],
-
-            # pm tweebot camera variables
-            'PM ANDOR center x': ['pmX', 'andorCenter'],
-            'PM ANDOR center y': ['pmY', 'andorCenter'],
-            'PM ANDOR range x': ['pmX', 'andorRange'],
-            'PM ANDOR range y': ['pmY', 'andorRange'],
-
-            'PM CCD center x': ['pmX', 'ccdCenter'],
-            'PM CCD center y': ['pmY', 'ccdCenter'],
-            'PM CCD range x': ['pmX', 'ccdRange'],
-            'PM CCD range y': ['pmY', 'ccdRange'],
-
-            # bead
-            'PM bead diameter': ['pmX', 'beadDiameter'],
-            'diameterT1.um': ['pmX', 'beadDiameter'],
-            'PM bead radius': ['pmX', 'beadRadius'],
-
-            'AOD bead diameter': ['aodX', 'beadDiameter'],
-            'diameterT2.um': ['aodX', 'beadDiameter'],
-            'AOD bead radius': ['aodX', 'beadRadius'],
-
-            # andor camera specifics
-            'ANDOR pixel size x': 'andorXPixelSize',
-            'ANDOR pixel size y': 'andorYPixelSize',
-
-            # ccd camera specifics
-            'CCD pixel size x': 'ccdXPixelSize',
-            'CCD pixel size y': 'ccdYPixelSize'
-        }
-
-        res = key
-        if key in keyMapper.keys():
-            res = keyMapper[key]
-        # make sure we return a list
+        res = HEADER_KEYS.get(key, key)
+        # make sure we return a list, copy it so callers can't modify the mapping
         if isinstance(res, str):
             return [res]
         else:
-            return res
+            return list(res)
 
     @staticmethod
     def getValueType(key, value):
@@ -527,71 +605,12 @@ class TxtMpiFile:
             converted value
         """
 
-        keyMapper = {
-
-            # general stuff
-            'title': str,
-            'time': str,
-
-            # axis variables
-            'forceSensitivity': float,
-
-            # general stuff
-            'date': lambda x: x.replace('\t', ' '),
-            'isDataAveraged': ixo.strToBool,
-            'nSamples': lambda x: int(float(x)),
-            'psdNSamples': int,
-            'psdSamplingRate': int,
-            'tsNSamples': int,
-            'tsTimeStep': float,
-            'samplingRate': int,
-            'recordingRate': int,
-            'measurementDuration': float,
-            'timeStep': float,
-            'dt': float,
-            'psdBlockLength': int,
-            'psdOverlap': int,
-            'psdNBlocks': lambda x: int(float(x)),
-            'viscosity': float,
-
-            'laserDiodeTemp': float,
-            'laserDiodeHours': float,
-            'laserDiodeCurrent': float,
-
-            'errors': lambda x: [int(error) for error in x.split('\t')],
-
-            'startOfMeasurement': int,
-            'endOfMeasurement': int,
-
-            # axis variables
-            'cornerFrequency': float,
-            'zeroOffset': float,
-            'stiffness': float,
-            'displacementSensitivity': lambda x: 1 / float(x),
-
-            # bead
-            'beadDiameter': float,
-            'beadRadius': float,
-
-            # tweebot camera variables
-            'andorCenter': float,
-            'andorRange': float,
-            'ccdCenter': float,
-            'ccdRange': float,
-
-            # andor camera specifics
-            'andorXPixelSize': float,
-            'andorYPixelSize': float,
-
-            # ccd camera specifics
-            'ccdXPixelSize': float,
-            'ccdYPixelSize': float,
-        }
-
-        if key in keyMapper:
-            return keyMapper[key](value)
-        else:
+        # single lookup instead of a membership test followed by indexing
+        convert = HEADER_VALUE_TYPES.get(key)
+        if convert is None:
             return value
+        else:
+            return convert(value)
 
     @staticmethod
     def isIgnoredHeader(line):
@@ -605,12 +624,7 @@ class TxtMpiFile:
             :class:`bool`
         """
 
-        ignoredLines = [
-            '# Laser Diode Status',
-            '# results thermal calibration:',
-        ]
-
-        if line in ignoredLines:
+        if line in IGNORED_HEADER_LINES:
             return True
         elif line.startswith('### File created by selecting data between'):
             return True
@@ -10,8 +10,12 @@ from .BaseSource import BaseSource
 from tweezers.meta import MetaDict, UnitDict
 
 
+# file name pattern of valid data files, compiled once on import
+DATA_FILE_RE = re.compile(r'^(?:(?P<type>[A-Z]+)_)?(?P<id>(?P<trial>[0-9]{1,3})_Date_[0-9_]{19})\.txt$')
+
+
 class TxtMpiSource(BaseSource):
-    """
+    r"""
     Data source for \*.txt files from the MPI with the old style header or the new JSON format.
     """
 
@@ -42,16 +46,18 @@ class TxtMpiSource(BaseSource):
         Checks if a given file is a valid data file and returns its ID and type.
 
         Args:
-            path (:class:`pathlib.Path`): file to check
+            path (:class:`pathlib.Path`, :class:`os.DirEntry` or `str`): file to check
 
         Returns:
             :class:`dict` with `id` and `type`
         """
 
-        pPath = Path(path)
-        m = re.match('^((?P<type>[A-Z]+)_)?(?P<id>(?P<trial>[0-9]{1,3})_Date_[0-9_]{19})\.txt$',
-                     pPath.name)
+        name = os.path.basename(path)
+        if not name.endswith('.txt'):
+            return False
+        m = DATA_FILE_RE.match(name)
         if m:
+            pPath = Path(path)
             tipe = 'data'
             if m.group('type'):
                 tipe = m.group('type').lower()
@@ -302,12 +308,13 @@ class TxtMpiSource(BaseSource):
             * data (:class:`pandas.DataFrame`)
         """
 
-        data['time'] = np.arange(0, meta['dt'] * len(data), meta['dt'])
+        # scale an integer range instead of stepping by a float, this always gives exactly one value per row
+        data['time'] = np.arange(len(data)) * meta['dt']
         units['time'] = 's'
 
-        meta, units, data = self.calculateForce(meta, units, data)
+        meta, units, data = TxtMpiSource.calculateForce(meta, units, data)
 
-        data['distance'] = np.sqrt(data.xDist**2 + data.yDist**2)
+        data['distance'] = np.hypot(data.xDist, data.yDist)
         units['distance'] = 'nm'
 
         return meta, units, data
@@ -387,10 +394,7 @@ class TxtMpiSource(BaseSource):
         """
 
         # ensure directory exists
-        try:
-            os.makedirs(str(path.parent))
-        except FileExistsError:
-            pass
+        os.makedirs(str(path.parent), exist_ok=True)
 
         # write the data
         with path.open(mode='w', encoding='utf-8') as f:
@@ -26,14 +26,13 @@ class AttrDictMixin(object):
             raise AttributeError("'{}' object has no attribute '{}'".format(self.__class__.__name__, name))
 
     def __setattr__(self, name, value):
-        # calling super-method here since we reimplemented __dir__ below
-        if name in super().__dir__():
+        if self._isAttribute(name):
             return super().__setattr__(name, value)
         else:
             self[name] = value
 
     def __delattr__(self, name):
-        if name in super().__dir__():
+        if self._isAttribute(name):
             return super().__delattr__(name)
         elif name in self.keys():
             del self[name]
@@ -43,6 +42,11 @@ class AttrDictMixin(object):
     def __dir__(self):
         return super().__dir__() + list(self.keys())
 
+    def _isAttribute(self, name):
+        # same lookup as 'name in super().__dir__()' (we reimplemented __dir__ above) but without building and
+        # searching the full list of attributes on every assignment
+        return name in self.__dict__ or any(name in vars(cls) for cls in type(self).__mro__)
+
 
 class IndexedOrderedDict(AttrDictMixin, OrderedDict):
     """
@@ -247,12 +251,13 @@ def dictStructure(dictionary, indent=4, level=0):
         raise AttributeError('dictStructure: No dict given')
 
     indentString = ' ' * indent * level
-    content = ''
+    # collect the lines and join them once, repeated string concatenation copies the whole content on every line
+    content = []
     for key, item in dictionary.items():
         if isinstance(item, dict):
-            content += '{}{}:\n'.format(indentString, key)
-            content += dictStructure(item, indent=indent, level=level+1)
+            content.append('{}{}:\n'.format(indentString, key))
+            content.append(dictStructure(item, indent=indent, level=level+1))
         else:
-            content += '{}{}: {}\n'.format(indentString, key, type(item))
+            content.append('{}{}: {}\n'.format(indentString, key, type(item)))
 
-    return content
+    return ''.join(content)
@@ -1,5 +1,4 @@
 from pathlib import Path
-import re
 from collections import OrderedDict
 
 
@@ -82,47 +81,23 @@ def getSimilarFiles(path, foldersApart=0, categories=[], discardIncomplete=True)
     files = OrderedDict()
     for category in categories:
         foundFiles = getFiles(path, prefix=category[0], suffix=category[1], recursive=True, hiddenFiles=False)
-        # create regex string for core name extraction
-        reStr = '^'
-        if category[0]:
-            reStr += re.escape(category[0])
-        reStr += '(.*)'
-        # deprecated: kept here in case some code relies on it and it needs reactivation, delete after Jan 2016
-        # add optional stuff to be cut from the end
-        # reStr += '(' + cutFromEnd + ')?'
-        if category[1]:
-            reStr += re.escape(category[1])
-        reStr += '$'
+        # getFiles only returns files starting with the prefix and ending with the suffix, so the core name can be
+        # sliced out directly instead of running a regex substitution on every file name
+        start = len(category[0]) if category[0] else 0
+        end = len(category[1]) if category[1] else 0
         # add to dictionary: key is the Path object of the file and value its core name (name without prefix and suffix)
         for file in foundFiles:
-            files[file] = re.sub(reStr, '\g<1>', file.name)
-
-    matchedFiles = []
-    try:
-        file, coreName = files.popitem()
-    except KeyError:
-        return matchedFiles
-    # for each file...
-    while file:
-        match = [file]
-        # check if there are similar files
-        for cFile, cCoreName in files.items():
-            if coreName != cCoreName:
-                continue
-            elif file.parents[foldersApart] != cFile.parents[foldersApart]:
-                continue
-            # append matched file to list
-            match.append(cFile)
-        # remove matched files from 'files' dict => each file can only be matched once
-        for key in match[1:]:
-            files.pop(key)
-        matchedFiles.append(match)
-
-        # get next item
-        try:
-            file, coreName = files.popitem()
-        except KeyError:
-            file = False
+            name = file.name
+            if len(name) >= start + end:
+                name = name[start:len(name) - end]
+            files[file] = name
+
+    # group the files by core name and shared parent folder in a single pass instead of comparing each file with all
+    # remaining ones, go through them in reverse to keep the order of the groups the same as before
+    groups = OrderedDict()
+    for file, coreName in reversed(list(files.items())):
+        groups.setdefault((coreName, file.parents[foldersApart]), []).append(file)
+    matchedFiles = list(groups.values())
 
     # sort resulting list
     for res in matchedFiles:
@@ -130,8 +105,6 @@ def getSimilarFiles(path, foldersApart=0, categories=[], discardIncomplete=True)
 
     # discard all sublists that do not have the proper number of files
     if discardIncomplete:
-        for key in matchedFiles:
-            if len(matchedFiles[key]) is not len(categories):
-                matchedFiles.pop(key)
+        matchedFiles = [res for res in matchedFiles if len(res) == len(categories)]
 
     return matchedFiles
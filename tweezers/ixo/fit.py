@@ -54,8 +54,7 @@ class Fit:
             :class:`list` of :class:`float`, depending on the input
         """
 
-        fit = self.fcn(self.x, *self.coef)
-        return fit
+        return self.eval(self.x)
 
     @property
     def rsquared(self):
@@ -80,7 +79,9 @@ class Fit:
             :class:`numpy.ndarray`
         """
 
-        return (self.y - self.yFit) / self.yFit
+        # evaluate the fitted function only once
+        yFit = self.yFit
+        return (self.y - yFit) / yFit
 
     @property
     def meanResidual(self):
@@ -91,7 +92,8 @@ class Fit:
             :class:`float`
         """
 
-        return np.sum(self.residuals) / len(self.yFit)
+        residuals = self.residuals
+        return np.sum(residuals) / len(residuals)
 
     @property
     def chisquared(self):
@@ -200,8 +202,9 @@ class PolyFit(Fit):
             :class:`numpy.ndarray` of parameters as determined by the fit.
         """
 
-        mi = min(self.x)
-        ma = max(self.x)
+        # vectorized reductions instead of the builtins, which iterate element-wise in Python
+        mi = np.min(self.x)
+        ma = np.max(self.x)
         #TODO: check for fitError
         poly = np.polynomial.Polynomial.fit(self.x, self.y, deg=self.order, w=self.std,
                                             domain=[mi, ma], window=[mi, ma])
@@ -233,17 +236,6 @@ class PolyFit(Fit):
 
         return self.poly.coef
 
-    @property
-    def yFit(self):
-        """
-        Attribute to hold the y values of the fitted curve. Evaluated lazily.
-
-        Returns:
-            :class:`numpy.ndarray`
-        """
-
-        return self.poly(self.x)
-
     def eval(self, x):
         """
         Evaluate the fitted polynomial for the given x values.
@@ -4,6 +4,12 @@ import re
 import pandas as pd
 
 
+# dataframe entries in the encoded JSON string and the line breaks within their value lists, compiled once on import
+# instead of on every encoding
+DATAFRAME_JSON_RE = re.compile(r'("_type": "dataframe",\s*"value": {\n)(.*?\[\n[\s\S]*?)}')
+VALUE_LINE_BREAK_RE = re.compile(r'\n\s*(?=[\d\]-])')
+
+
 def getSubdirs(path):
     """
     Get all subdirectories
@@ -35,13 +41,11 @@ class DataFrameJsonEncoder(json.JSONEncoder):
         jsonStr = super().encode(obj)
 
         # manipulate to prettify dataframe JSON format
-        rxType = re.compile(r'("_type": "dataframe",\s*"value": {\n)(.*?\[\n(.|\n)*?)}')
-        rxRepl = re.compile(r'\n\s*(?=(\d|]|-))')
         while True:
-            res = rxType.search(jsonStr)
+            res = DATAFRAME_JSON_RE.search(jsonStr)
             if not res:
                 break
-            tmpStr = rxRepl.sub(r' ', res.group(2))
+            tmpStr = VALUE_LINE_BREAK_RE.sub(r' ', res.group(2))
             jsonStr = jsonStr.replace(res.group(2), tmpStr)
 
         return jsonStr
@@ -52,7 +56,7 @@ class DataFrameJsonDecoder(json.JSONDecoder):
     JSON decoder that allows reading a :class:`pandas.DataFrame` from a JSON file.
     """
     def __init__(self, *args, **kwargs):
-        json.JSONDecoder.__init__(self, object_hook=self.object_hook, *args, **kwargs)
+        super().__init__(*args, object_hook=self.object_hook, **kwargs)
 
     def object_hook(self, obj):
         if '_type' not in obj:
@@ -15,9 +15,11 @@ def averageData(data, nsamples=10):
 
     group = data.groupby(data.index // nsamples)
     avData = group.mean()
-    avData['time'] = group.first()['time']
+    # time columns hold the first value of each bin, only aggregate those instead of running first() on all columns
+    timeCols = ['time']
     if 'absTime' in data.columns:
-        avData['absTime'] = group.first()['absTime']
+        timeCols.append('absTime')
+    avData[timeCols] = group[timeCols].first()
 
     return avData
 
@@ -35,25 +37,24 @@ def correlate(x, y, length=20):
         np.array
     """
 
-    def corr_coeff(x, y, meanX, meanY, stdX, stdY):
-        # this assumes x and y of same length
-        return 1.0/len(x) * np.sum((x - meanX) * (y - meanY)) / (stdX * stdY)
-
     #TODO: check dimensions of x and y, if they are 2-D, assume that they contain x and y values
 
     # use corrected sample standard deviation
     ddof = 1
-    meanX = np.mean(x[:, 1])
     stdX = np.std(x[:, 1], ddof=ddof)
-    meanY = np.mean(y[:, 1])
     stdY = np.std(y[:, 1], ddof=ddof)
+    # subtract the means once for all lags instead of for each lagged slice
+    devX = x[:, 1] - np.mean(x[:, 1])
+    devY = y[:, 1] - np.mean(y[:, 1])
+    norm = stdX * stdY
 
     res = np.zeros((length + 1, 2))
     # calculate first column values
     res[:, 0] = (x[1, 0] - x[0, 0]) * np.arange(length + 1)
 
-    res[0, 1] = corr_coeff(x[:, 1], y[:, 1], meanX, meanY, stdX, stdY)
+    # this assumes x and y of same length
+    res[0, 1] = np.dot(devX, devY) / len(devX) / norm
     for i in range(1, length + 1):
-        res[i, 1] = corr_coeff(x[i:, 1], y[:-i, 1], meanX, meanY, stdX, stdY)
+        res[i, 1] = np.dot(devX[i:], devY[:-i]) / len(devX[i:]) / norm
 
     return res
\ No newline at end of file
@@ -1,6 +1,11 @@
 import logging as log
 
 
+# accepted string representations of boolean values
+TRUE_STRINGS = frozenset(['true', 't', 'yes', '1', 'on'])
+FALSE_STRINGS = frozenset(['false', 'f', 'no', '0', 'off'])
+
+
 def strToBool(value):
     """
     Convert a string representation of a boolean value to a :class:`bool`.
@@ -12,13 +17,10 @@ def strToBool(value):
         :class:`bool`
     """
 
-    true = ['true', 't', 'yes', '1', 'on']
-    false = ['false', 'f', 'no', '0', 'off']
-
     value = value.lower()
-    if value in true:
+    if value in TRUE_STRINGS:
         return True
-    elif value in false:
+    elif value in FALSE_STRINGS:
         return False
     else:
         raise ValueError
@@ -1,5 +1,7 @@
-from collections import Mapping
+from collections.abc import Mapping
+from types import MappingProxyType
 import pprint
+import sys
 import pandas as pd
 import logging as log
 from datetime import datetime
@@ -18,7 +20,7 @@ class MetaBaseDict(IndexedOrderedDict):
     meta data. The reference is the header of the Biotec txt files.
     """
 
-    defaults = {}
+    defaults = MappingProxyType({})
 
     warningString = ''
 
@@ -114,8 +116,11 @@ class MetaBaseDict(IndexedOrderedDict):
 
         # add an extra column with the timestamp if 'date' column is available
         if 'date' in facets.columns:
-            getTimestamp = lambda row: datetime.strptime(row.date, '%d.%m.%Y %H:%M:%S').timestamp()
-            facets['timestamp'] = facets.apply(getTimestamp, axis=1)
+            # the date is general metadata and thus the same in most rows, parse each distinct value only once instead
+            # of running strptime row by row
+            timestamps = {date: datetime.strptime(date, '%d.%m.%Y %H:%M:%S').timestamp()
+                          for date in facets['date'].unique()}
+            facets['timestamp'] = facets['date'].map(timestamps)
 
         return facets
 
@@ -172,10 +177,12 @@ class MetaDict(MetaBaseDict):
     A class to hold metadata.
     """
 
-    defaults = {'title': 'no title',
+    # read-only, shared by every MetaDict
+    defaults = MappingProxyType({
+                'title': 'no title',
                 'temperature': 25,
                 'psdSamplingRate': 80000
-    }
+    })
 
     warningString = 'Meta values: '
 
@@ -184,7 +191,9 @@ class UnitDict(MetaBaseDict):
     """
     Store units corresponding to metadata.
     """
-    defaults = {'viscosity': 'pN s / nm^2',
+    # read-only and interned, the same unit strings are shared by every UnitDict
+    defaults = MappingProxyType({key: sys.intern(value) for key, value in {
+                'viscosity': 'pN s / nm^2',
                 'pmXDiff': 'V',
                 'pmYDiff': 'V',
                 'aodXDiff': 'V',
@@ -193,6 +202,6 @@ class UnitDict(MetaBaseDict):
                 'psdSamplingRate': 'Hz',
                 'psd': 'V^2/Hz',
                 'timeseries': 'V',
-    }
+    }.items()})
 
     warningString = 'Units: '
@@ -11,7 +11,8 @@ def volumeSphere(radius=1000):
     Returns:
         volume (float): Volume in [input units³]
     """
-    assert radius > 0
+    # validate the whole input once, the formula itself works element-wise on arrays
+    assert np.all(radius > 0)
 
     volume = 4 / 3 * np.pi * radius**3
 
@@ -32,7 +33,7 @@ def massSphere(radius=1000, density=1e-21,
     Returns:
         mass (float):  Mass in [g]
     """
-    assert radius > 0
+    assert np.all(radius > 0)
     assert density > 0
 
     volume = volumeSphere(radius=radius)
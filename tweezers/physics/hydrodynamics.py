@@ -36,9 +36,9 @@ def diffusionCoefficient(radius=1000, temperature=25, viscosity=1e-9, verbose=Fa
         :class:`float` Diffusion constant in [nm^2 / s]
     """
 
-    assert radius > 0
-    assert temperature >= -273.15
-    assert viscosity > 0
+    assert np.all(radius > 0)
+    assert np.all(temperature >= -273.15)
+    assert np.all(viscosity > 0)
 
     kT = kbt(temperature)
     drag = dragSphere(radius=radius, viscosity=viscosity)
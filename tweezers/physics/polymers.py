@@ -1,4 +1,5 @@
 from scipy.constants import Boltzmann
+import math
 import numpy as np
 
 from tweezers.physics.thermodynamics import kbt
@@ -21,8 +22,15 @@ def extWlc(F, p=50, S=1000, L=1000, T=25):
 
     # extensible worm-like chain model
 
-    # calculate distance
-    d = L * (1 - 0.5 * np.sqrt(kbt(T) / (F * p)) + F / S)
+    # calculate distance, compute kbt / p before dividing by the force array
+    kbtp = kbt(T) / p
+    # plain Python forces, e.g. from a root finder, don't need to go through numpy if all other parameters are plain
+    # numbers as well; numpy scalars keep their numpy return type and negative forces are left to numpy to keep
+    # returning NaN for them
+    if (type(F) in (int, float) and type(kbtp) is float and type(L) in (int, float) and type(S) in (int, float)
+            and F > 0):
+        return L * (1 - 0.5 * math.sqrt(kbtp / F) + F / S)
+    d = L * (1 - 0.5 * np.sqrt(kbtp / F) + F / S)
     return d
 
 
@@ -41,15 +49,17 @@ def dnaTwistStretchCoupling(F):
     g0 = -637
     g1 = 17.9
 
-    g = np.zeros_like(F)
-    g[F < Fc] = -100
-    g[F >= Fc] = g0 + g1 * F[F >= Fc]
-    return g
+    # single pass without building and indexing with two masks, also works for scalar forces
+    F = np.asarray(F)
+    g = np.where(F < Fc, -100.0, g0 + g1 * F)
+    # unwrap the 0-d result of scalar forces, arrays are returned as they are
+    return g[()]
 
 
 def tWlc(F, p=50, S=1000, C=440, L=1000, T=25):
 
     g = dnaTwistStretchCoupling(F)
     # twistable worm-like chain
-    d = L * (1 - 0.5 * np.sqrt(kbt(T) / (F * p)) + C * F / (-g**2 + S * C))
+    kbtp = kbt(T) / p
+    d = L * (1 - 0.5 * np.sqrt(kbtp / F) + C * F / (S * C - g**2))
     return d
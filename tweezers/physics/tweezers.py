@@ -4,6 +4,10 @@ from .hydrodynamics import dragSphere
 from .thermodynamics import kbt
 
 
+# squared pi used by the Lorentzian, computed once at import
+PI_SQUARED = math.pi ** 2
+
+
 def trapStiffness(fc=500, radius=1000, viscosity=8.93e-10):
     """
     Returns the trap stiffness (proposed units: [pN/nm])
@@ -54,7 +58,8 @@ def lorentzian(f, fc, D):
         :class:`numpy.array`
     """
 
-    return D / (np.pi ** 2 * (f ** 2 + fc ** 2))
+    # scale the scalar diffusion constant first, this saves a multiplication over the whole frequency array
+    return D / PI_SQUARED / (f ** 2 + fc ** 2)
 
 
 def psdDiode(f, fc, D, fd3, a):
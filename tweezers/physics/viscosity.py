@@ -10,13 +10,13 @@ The following variables are used:
 Temperature T: [0, 100] in [C]
 """
 
-from numpy import exp
+from numpy import exp, isscalar
 
 
 def dynamicViscosityWaterGlycerol(waterVolume=1,
                                      glycerolVolume=0,
                                      temperature=25):
-    """
+    r"""
     Power law equation for the dynamic viscosity of a water \
     to glycerol mixture according to:
 
@@ -32,14 +32,14 @@ def dynamicViscosityWaterGlycerol(waterVolume=1,
 
     """
 
-    # read input
-    T = float(temperature)
+    # read input, scalars (e.g. strings from parsed metadata) are converted, arrays are passed on
+    T = float(temperature) if isscalar(temperature) else temperature
     wV = float(waterVolume)
     gV = float(glycerolVolume)
 
     # get component viscosities
-    mu_w = dynamicViscosityWater(temperature)
-    mu_g = dynamicViscosityGlycerol(temperature)
+    mu_w = dynamicViscosityWater(T)
+    mu_g = dynamicViscosityGlycerol(T)
     Cm = calcGlycerolFractionByMass(wV, gV, T)
 
     # compute coefficient required by Cheng formula
@@ -54,7 +54,7 @@ def dynamicViscosityWaterGlycerol(waterVolume=1,
 
 
 def dynamicViscosityWater(temperature=25):
-    """
+    r"""
     Calculates :math:`\mu_w`, the dynamic viscosity of water, using the interpolation formula of Cheng.
 
     Args:
@@ -63,7 +63,7 @@ def dynamicViscosityWater(temperature=25):
     Returns:
         :class:`float` Dynamic viscosity of water in [0.001 N s / m^2]
     """
-    T = float(temperature)
+    T = float(temperature) if isscalar(temperature) else temperature
     mu = 1.790 * exp(((-1230 - T) * T) / (36100 + 360 * T))
     waterDynamicViscosity = 0.001 * mu
 
@@ -71,7 +71,7 @@ def dynamicViscosityWater(temperature=25):
 
 
 def dynamicViscosityGlycerol(temperature=25):
-    """
+    r"""
     Calculates :math:`\mu_g`, the dynamic viscosity of glycerol, using the interpolation formula of Cheng.
 
     Args:
@@ -80,7 +80,7 @@ def dynamicViscosityGlycerol(temperature=25):
     Returns:
         :class:`float` Dynamic viscosity of glycerol in [0.001 N s / m^2]
     """
-    T = float(temperature)
+    T = float(temperature) if isscalar(temperature) else temperature
     mu = 12100 * exp(((-1233 + T) * T) / (9900 + 70 * T))
     glycerolDynamicViscosity = 0.001 * mu
 
@@ -132,9 +132,9 @@ def densityWaterGlycerol(waterVolume, glycerolVolume, temperature=25):
     Returns:
         :class:`float` density of the mixture in kg/m^3
     """
-    T = float(temperature)
-    rW = densityWater(temperature)
-    rG = densityGlycerol(temperature)
+    T = float(temperature) if isscalar(temperature) else temperature
+    rW = densityWater(T)
+    rG = densityGlycerol(T)
     Cm = calcGlycerolFractionByMass(waterVolume, glycerolVolume, T)
 
     rho = rG * Cm + rW * (1 - Cm)
@@ -202,7 +202,7 @@ def calcGlycerolFractionByMass(waterVolume, glycerolVolume, temperature):
     Returns:
         :class:`float` Fraction of glycerol by mass in [0, 1]
     """
-    T = float(temperature)
+    T = float(temperature) if isscalar(temperature) else temperature
     wM = calcMass(waterVolume, densityWater(T))
     gM = calcMass(glycerolVolume, densityGlycerol(T))
 
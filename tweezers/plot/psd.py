@@ -64,7 +64,7 @@ class PsdPlotBase:
         """
 
         for title in container.psd.columns:
-            if title is not 'f' and not title.lower().endswith('std') and not title.lower().endswith('fit'):
+            if title != 'f' and not title.lower().endswith('std') and not title.lower().endswith('fit'):
                 self.psdAxes.append(title)
 
     def plotPsd(self, ax, f, psd, units=None, *args, **kwargs):
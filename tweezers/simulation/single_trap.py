@@ -9,6 +9,9 @@ class Sphere:
     Represents a sphere and gives an interface to compute its properties.
     """
 
+    # fixed set of properties, no per-instance __dict__ required
+    __slots__ = ('radius', 'density', 'viscosity', 'temperature')
+
     def __init__(self, radius, density=1e-21, viscosity=1e-9, temperature=25):
         """
         Constructor for Sphere
@@ -69,6 +72,8 @@ class SingleTrap:
         self.A = self.aValues()
         self.alpha = self.alphaValue()
         self.expM = self.exp_matrix()
+        # the step vectors only depend on the values above, compute them once instead of on every step
+        self.stepA, self.stepB = self.stepVectors()
 
     def eigenvalues(self):
         """
@@ -152,6 +157,26 @@ class SingleTrap:
 
         return prefactor * M
 
+    def stepVectors(self):
+        """
+        Calculates the two deterministic vectors of a simulation step according to Norrelykke et al. A step is given by
+        ``randn() * a + randn() * b``, see :meth:`step`.
+
+        Returns:
+            a (np.array), b (np.array): vectors that are scaled by normally distributed random numbers
+        """
+
+        l = self.ev
+        A = self.A
+
+        v1 = np.array([-1, l['plus']])
+        v2 = np.array([1, -l['minus']])
+
+        a = (A['plus'] * v1 + A['minus'] * v2) * np.sqrt(1 + self.alpha)
+        b = (A['plus'] * v1 - A['minus'] * v2) * np.sqrt(1 - self.alpha)
+
+        return a, b
+
     def step(self):
         """
         Calculates single step in the simulation of OTs according to Norrelykke et al.
@@ -164,14 +189,9 @@ class SingleTrap:
         Returns:
             step (np.array): Simulation step; step[0] - deltaX in [nm], step[1] - deltaV in [nm/s]
         """
-        l = self.ev
-        A = self.A
 
-        v1 = np.array([-1, l['plus']])
-        v2 = np.array([1, -l['minus']])
-
-        partA = (A['plus'] * v1 + A['minus'] * v2) * np.sqrt(1 + self.alpha) * np.random.randn()
-        partB = (A['plus'] * v1 - A['minus'] * v2) * np.sqrt(1 - self.alpha) * np.random.randn()
+        partA = self.stepA * np.random.randn()
+        partB = self.stepB * np.random.randn()
 
         # keep in mind that:
         # deltaX = partA[0] + partB[0]
@@ -200,14 +220,25 @@ class SingleTrap:
         assert self.timeStep > 0
         assert datapoints > 0
 
-        # initialise variables
-        state = np.zeros((datapoints, 3))
-        state[:, 0] = np.arange(0, self.timeStep * datapoints, self.timeStep)
+        n = int(datapoints)
 
-        # do it
-        for i in range(int(datapoints) - 1):
-            state[i + 1, 1:3] = state[i, 1:3] * self.expM + self.step()
+        # initialise variables
+        state = np.zeros((n, 3))
+        state[:, 0] = np.arange(n) * self.timeStep
+
+        # draw all random numbers at once, in the same order as :meth:`step` would, and compute all steps in one go
+        noise = np.random.randn(n - 1, 2)
+        steps = noise[:, :1] * self.stepA + noise[:, 1:] * self.stepB
+
+        # the recursion itself can't be vectorized, but plain float arithmetic is much faster than a matrix
+        # multiplication per data point
+        ((m00, m01), (m10, m11)) = np.asarray(self.expM).tolist()
+        x = v = 0.0
+        for i, (dx, dv) in enumerate(steps.tolist(), start=1):
+            x, v = x * m00 + v * m10 + dx, x * m01 + v * m11 + dv
+            state[i, 1] = x
+            state[i, 2] = v
 
         #TODO: add time index to pd.DataFrame; makes for easier plotting as time is inherent
         state = pd.DataFrame(state, columns=['t', 'x', 'v'])
-        return state
\ No newline at end of file
+        return state